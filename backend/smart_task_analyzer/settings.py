@@ -48,6 +48,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -59,6 +60,13 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = 'smart_task_analyzer.urls'
 
+# Encode every API response with orjson's C encoder instead of stdlib json.
+REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': [
+        'taskapi.renderers.ORJSONRenderer',
+    ],
+}
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
@@ -127,6 +135,11 @@ STATICFILES_DIRS = [
     BASE_DIR.parent / 'frontend',
 ]
 
+# Serve the frontend assets (css/js/assets) straight from WhiteNoise at the
+# URL root instead of routing every file through django.views.static.serve.
+WHITENOISE_ROOT = BASE_DIR.parent / 'frontend'
+WHITENOISE_MAX_AGE = 3600
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
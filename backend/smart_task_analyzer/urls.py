@@ -17,22 +17,11 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include
 from django.views.generic import TemplateView
-from django.conf import settings
-from django.views.static import serve
-from pathlib import Path
-
-FRONTEND_DIR = Path(settings.BASE_DIR).parent / 'frontend'
 
+# Frontend static files (css/js/assets) are served by WhiteNoise from
+# WHITENOISE_ROOT — see settings.py — instead of django.views.static.serve.
 urlpatterns = [
     path('', TemplateView.as_view(template_name='index.html'), name='home'),
     path('admin/', admin.site.urls),
     path('api/tasks/', include('taskapi.urls')),
 ]
-
-if settings.DEBUG:
-    # Serve frontend static files (css/js/assets) during development
-    urlpatterns += [
-        path('css/<path:path>', serve, {'document_root': FRONTEND_DIR / 'css'}),
-        path('js/<path:path>', serve, {'document_root': FRONTEND_DIR / 'js'}),
-        path('assets/<path:path>', serve, {'document_root': FRONTEND_DIR / 'assets'}),
-    ]
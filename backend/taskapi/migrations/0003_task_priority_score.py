@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-09-01 16:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taskapi', '0002_task_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='priority_score',
+            field=models.FloatField(db_index=True, default=0.0),
+        ),
+    ]
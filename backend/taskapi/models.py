@@ -7,6 +7,12 @@ class Task(models.Model):
     estimated_hours = models.FloatField(default=1)
     importance = models.IntegerField(default=1)
     dependencies = models.ManyToManyField("self", blank=True, symmetrical=False)
+    # Cheap table version signal: (max updated_at, count) changes whenever
+    # any task changes, so cached scoring results can be keyed on it.
+    updated_at = models.DateTimeField(auto_now=True)
+    # Last computed engine score, persisted so consumers can order by
+    # priority SQL-side (indexed ORDER BY ... LIMIT) without re-scoring.
+    priority_score = models.FloatField(default=0.0, db_index=True)
 
     def __str__(self):
         return self.title
\ No newline at end of file
@@ -0,0 +1,18 @@
+import orjson
+from rest_framework.renderers import BaseRenderer
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    JSON renderer backed by orjson's C encoder. Serializes straight to
+    bytes (no intermediate str), handles dates natively, and understands
+    NumPy scalars/arrays via OPT_SERIALIZE_NUMPY.
+    """
+    media_type = "application/json"
+    format = "json"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
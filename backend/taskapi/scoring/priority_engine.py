@@ -3,23 +3,79 @@ from collections import defaultdict
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from functools import lru_cache
 from math import log1p
 import datetime
 import holidays   # pip install holidays
-from collections import defaultdict
+import hashlib
+import numpy as np
+from collections import defaultdict, namedtuple, OrderedDict
+from graphlib import TopologicalSorter
+
+from taskapi.serializers import TaskInputSerializer
+
+
+@lru_cache(maxsize=64)
+def _holiday_weekday_ordinals(start_year, end_year):
+    """
+    Sorted int64 ordinals of Indian holidays that fall on weekdays, cached
+    per year span. The old day-by-day loop rebuilt the holiday calendar on
+    every single iteration.
+    """
+    calendar = holidays.country_holidays("IN", years=range(start_year, end_year + 1))
+    ordinals = np.fromiter(
+        (d.toordinal() for d in calendar if d.weekday() < 5), dtype=np.int64
+    )
+    ordinals.sort()
+    return ordinals
 
 
 def working_days_between(d1, d2):
-    days = 0
-    for i in range((d2 - d1).days + 1):
-        day = d1 + datetime.timedelta(days=i)
-        if day.weekday() < 5 and day not in holidays.country_holidays("IN"):
+    total_days = (d2 - d1).days + 1
+    if total_days <= 0:
+        return -1
+
+    # Closed-form weekday count: each full week contributes 5 days, the
+    # ragged tail is walked from d1's weekday (at most 6 iterations).
+    full_weeks, extra = divmod(total_days, 7)
+    days = full_weeks * 5
+    start_weekday = d1.weekday()
+    for i in range(extra):
+        if (start_weekday + i) % 7 < 5:
             days += 1
+
+    # Subtract weekday holidays in [d1, d2]: two binary searches on the
+    # cached ordinal array count the whole intersection.
+    ordinals = _holiday_weekday_ordinals(d1.year, d2.year)
+    days -= int(
+        np.searchsorted(ordinals, d2.toordinal(), side="right")
+        - np.searchsorted(ordinals, d1.toordinal(), side="left")
+    )
     return days - 1
 
 
 
 
+# One scored entry per task. A namedtuple costs a fraction of the dict that
+# was allocated per task here (~72B vs ~240B) and is immutable, so cached
+# run() results can be shared without copying each entry.
+ScoredTask = namedtuple("ScoredTask", "task score")
+
+
+def _score_all(urgency, importance, effort, dep_count, centrality, depth,
+               w_urgency, w_importance, alpha):
+    """
+    Vectorized scoring kernel over struct-of-arrays inputs.
+    Mirrors `PriorityEngine.calculate_score` but computes every task's
+    final score in one NumPy pass instead of a per-task Python loop.
+    """
+    value = urgency * w_urgency + importance * w_importance
+    dep_factor = 1.0 + alpha * dep_count
+    discount = 1.0 / (1.0 + depth)
+    raw = value * dep_factor * centrality * effort * discount
+    return np.log1p(raw) / log1p(1 + 1000) * 100.0
+
+
 class PriorityEngine:
     """
     PriorityEngine V4 – Stable Graph-Aware Scheduler
@@ -42,9 +98,75 @@ class PriorityEngine:
     CENTRALITY_ITER = 12 # number of iterations for centrality calculation
 
     def __init__(self, tasks):
-        self.tasks = tasks
+        # Accept a queryset or a plain list. The graph structures only ever
+        # need dependency ids, so for querysets the adjacency comes straight
+        # from the M2M through table in one values_list query — no related
+        # manager, no Task instance hydration for dependency rows.
+        is_queryset = hasattr(tasks, "model")
+        self.tasks = list(tasks)
         self.today = datetime.date.today()
 
+        if is_queryset:
+            task_ids = [t.id for t in self.tasks]
+            through = tasks.model.dependencies.through
+            edges = through.objects.filter(
+                from_task_id__in=task_ids
+            ).values_list("from_task_id", "to_task_id")
+            self._dep_ids = {tid: [] for tid in task_ids}
+            for from_id, to_id in edges:
+                self._dep_ids[from_id].append(to_id)
+        else:
+            self._dep_ids = {
+                t.id: [d.id for d in t.dependencies.all()] for t in self.tasks
+            }
+        # Working-day deltas to each due date, computed once per task:
+        # run() and urgency_score would otherwise redo the calendar walk
+        # for every scoring pass and response field.
+        self._due_delta = {
+            t.id: working_days_between(self.today, t.due_date)
+            for t in self.tasks if t.due_date
+        }
+        # Final urgency values, memoized per task id: views may ask for
+        # the same task's urgency several times while building reasons.
+        self._urgency_cache = {}
+
+        # Struct-of-arrays extraction: pull the scalar scoring fields off
+        # the model instances once, already normalized, so the batch pass
+        # and the per-task score methods read plain dicts instead of going
+        # through attribute descriptors for every access.
+        self._hours_by_id = {t.id: self._raw_hours(t) for t in self.tasks}
+        self._imp_by_id = {}
+        for t in self.tasks:
+            imp = getattr(t, "importance", 5)
+            self._imp_by_id[t.id] = 5 if imp is None else imp
+
+        # Per-task subscores captured during run(); views read these when
+        # building "reason" payloads instead of recomputing each component.
+        self._reasons = {}
+
+        # Specialize the combine step once per engine with the weight
+        # constants folded in as immediates, so calculate_score does no
+        # self.* attribute lookups inside its arithmetic.
+        src = (
+            "def _combine(u, imp, eff, dep, cen, discount):\n"
+            f"    return (u * {self.W_URGENCY!r} + imp * {self.W_IMPORTANCE!r})"
+            " * dep * cen * eff * discount\n"
+        )
+        ns = {}
+        exec(src, ns)
+        self._combine = ns["_combine"]
+
+        self._dependents_count = defaultdict(int)
+        if self.tasks and hasattr(self.tasks[0], "num_dependents"):
+            # Counts were already aggregated SQL-side via
+            # .annotate(num_dependents=Count("task")) on the queryset.
+            for t in self.tasks:
+                self._dependents_count[t.id] = t.num_dependents
+        else:
+            for t in self.tasks:
+                for dep_id in self._dep_ids[t.id]:
+                    self._dependents_count[dep_id] += 1
+
     
     #  EFFORT SCORE FOR API RESPONSE
     
@@ -60,40 +182,81 @@ class PriorityEngine:
     #  DIRECT DEPENDENCY COUNT FOR API RESPONSE
     
     def dependency_score(self, task):
-        count = 0
-        for t in self.tasks:
-            if task in t.dependencies.all():
-                count += 1
-        return self.direct_dependency_factor(task, {task.id: count})
+        return self.direct_dependency_factor(task, self._dependents_count)
 
     
     #  CYCLE DETECTION
     
     def detect_cycles(self):
-        visited = set()
-        stack = set()
+        """
+        Iterative Tarjan SCC over the prefetched adjacency.
+        Every member of a strongly connected component of size > 1
+        (or with a self-edge) is cyclic. No recursion, single O(V+E) pass.
+        """
+        # Compact task ids to 0..n-1 so the traversal bookkeeping lives in
+        # flat lists and a bytearray flag instead of hashed dict/set probes.
+        ids = list(self._dep_ids)
+        pos = {tid: i for i, tid in enumerate(ids)}
+        n = len(ids)
+        adj = [
+            [pos[d] for d in self._dep_ids[tid] if d in pos]
+            for tid in ids
+        ]
+
+        UNVISITED = -1
+        index = [UNVISITED] * n
+        lowlink = [0] * n
+        on_stack = bytearray(n)
+        scc_stack = []
+        counter = 0
         cyclic = set()
 
-        def dfs(task):
-            if task.id in stack:
-                cyclic.add(task.id)
-                return True
-            if task.id in visited:
-                return False
-
-            visited.add(task.id)
-            stack.add(task.id)
-
-            for dep in task.dependencies.all():
-                if dfs(dep):
-                    cyclic.add(task.id)
-
-            stack.remove(task.id)
-            return False
-
-        for t in self.tasks:
-            if t.id not in visited:
-                dfs(t)
+        for root in range(n):
+            if index[root] != UNVISITED:
+                continue
+
+            work = [(root, iter(adj[root]))]
+            index[root] = lowlink[root] = counter
+            counter += 1
+            scc_stack.append(root)
+            on_stack[root] = 1
+
+            while work:
+                node, neighbors = work[-1]
+                advanced = False
+                for child in neighbors:
+                    if child == node:
+                        # Self-dependency is a cycle of its own.
+                        cyclic.add(ids[node])
+                    elif index[child] == UNVISITED:
+                        index[child] = lowlink[child] = counter
+                        counter += 1
+                        scc_stack.append(child)
+                        on_stack[child] = 1
+                        work.append((child, iter(adj[child])))
+                        advanced = True
+                        break
+                    elif on_stack[child] and index[child] < lowlink[node]:
+                        lowlink[node] = index[child]
+                if advanced:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if lowlink[node] < lowlink[parent]:
+                        lowlink[parent] = lowlink[node]
+
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = scc_stack.pop()
+                        on_stack[member] = 0
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1:
+                        cyclic.update(ids[m] for m in component)
 
         return list(cyclic)
 
@@ -104,28 +267,46 @@ class PriorityEngine:
         if not task.due_date:
             return 0.5
 
-        delta = working_days_between(self.today, task.due_date)
+        cached = self._urgency_cache.get(task.id)
+        if cached is not None:
+            return cached
+
+        delta = self._due_delta.get(task.id)
+        if delta is None:
+            delta = working_days_between(self.today, task.due_date)
 
         if delta < 0:
             overdue = abs(delta)
-            return 2.0 + min(overdue / 7.0, 1.0)
+            score = 2.0 + min(overdue / 7.0, 1.0)
+        else:
+            clamped = max(0, self.U_MAX - delta)
+            score = 1.0 + (clamped / self.U_MAX)
 
-        clamped = max(0, self.U_MAX - delta)
-        return 1.0 + (clamped / self.U_MAX)
+        self._urgency_cache[task.id] = score
+        return score
 
     def importance_score(self, task):
-        imp = getattr(task, "importance", 5)
+        imp = self._imp_by_id.get(task.id)
         if imp is None:
-            imp = 5
+            imp = getattr(task, "importance", 5)
+            if imp is None:
+                imp = 5
         imp = max(1, min(10, imp))
         return imp / 10.0
 
-    def effort_factor(self, task):
+    @staticmethod
+    def _raw_hours(task):
         hours = getattr(task, "estimated_hours", None)
         if hours is None:
             hours = getattr(task, "effort", 2.0)
         if hours is None or hours <= 0:
             hours = 1.0
+        return hours
+
+    def effort_factor(self, task):
+        hours = self._hours_by_id.get(task.id)
+        if hours is None:
+            hours = self._raw_hours(task)
         hours = max(hours, 0.1)
         return min(1.0 / hours, 10.0)
 
@@ -143,42 +324,111 @@ class PriorityEngine:
     #  More depth => bigger discount => lower priority
     
     def compute_depth(self, task, memo):
-        if task.id in memo:
-            return memo[task.id]
+        # Explicit-stack post-order walk: no recursion, so arbitrarily
+        # long dependency chains cannot blow the interpreter stack.
+        # run() computes depths in bulk via the topo sweep; this is the
+        # single-task entry point for callers outside a full run.
+        stack = [task.id]
+        # Nodes currently expanded on the stack. Re-expanding one means a
+        # dependency loops back on itself; without this guard the walk
+        # would push the same cycle forever.
+        in_progress = set()
+        while stack:
+            tid = stack[-1]
+            if tid in memo:
+                stack.pop()
+                in_progress.discard(tid)
+                continue
+            deps = self._dep_ids.get(tid, [])
+            pending = [d for d in deps if d not in memo]
+            if pending:
+                if tid in in_progress:
+                    raise ValueError(
+                        f"Cyclic dependency involving task {tid}"
+                    )
+                in_progress.add(tid)
+                stack.extend(pending)
+            else:
+                memo[tid] = 1 + max(memo[d] for d in deps) if deps else 0
+                stack.pop()
+                in_progress.discard(tid)
+        return memo[task.id]
+
+
+    #  TOPOLOGICAL ORDER (KAHN)
+    #  One O(V+E) pass over the valid subgraph; dependencies always come
+    #  before their dependents in the returned order.
 
-        deps = task.dependencies.all()
-        if not deps:
-            memo[task.id] = 0
-            return 0
+    @staticmethod
+    def _topo_order(deps_ids):
+        # graphlib expects node -> predecessors, which is exactly the
+        # shape of the dependency map; dependencies come out before their
+        # dependents. Cycles were already stripped by detect_cycles, so
+        # static_order cannot raise CycleError here.
+        return list(TopologicalSorter(deps_ids).static_order())
+
+    def _centrality_from_topo(self, order, dependents_ids):
+        # On a DAG the Katz propagation has a closed form: one sweep in
+        # reverse topological order replaces CENTRALITY_ITER full passes.
+        if not order:
+            return {}
+        beta = 1.0
+        lam = self.LAMBDA
+        get_children = dependents_ids.get
+        C = {}
+        for node in reversed(order):
+            C[node] = beta + lam * sum(
+                C[child] for child in get_children(node, ())
+            )
+        # Multiply by the reciprocal once instead of dividing per entry.
+        inv_max = 1.0 / max(C.values())
+        return {tid: c * inv_max for tid, c in C.items()}
 
-        depth = 1 + max(self.compute_depth(dep, memo) for dep in deps)
-        memo[task.id] = depth
-        return depth
 
-    
     #  GRAPH CENTRALITY USING KATZ PROPAGATION
-    
+
     def compute_centrality(self, dependents):
         if not self.tasks:
             return {}
 
         beta = 1.0
-        C = {t.id: beta for t in self.tasks}
-
-        for _ in range(self.CENTRALITY_ITER):
-            new_C = {}
-            for t in self.tasks:
-                score = beta
-                for child in dependents.get(t.id, []):
-                    score += self.LAMBDA * C.get(child, beta)
-                new_C[t.id] = score
-            C = new_C
-
-        max_val = max(C.values())
-        for tid in C:
-            C[tid] /= max_val
-
-        return C
+        ids = [t.id for t in self.tasks]
+        idx = {tid: i for i, tid in enumerate(ids)}
+        n = len(ids)
+
+        # Flatten the adjacency into parallel edge arrays so each Katz
+        # sweep is a single C-level gather + bincount instead of nested
+        # Python loops with dict lookups.
+        rows, cols = [], []
+        for tid, children in dependents.items():
+            i = idx.get(tid)
+            if i is None:
+                continue
+            for child in children:
+                j = idx.get(child)
+                if j is not None:
+                    rows.append(i)
+                    cols.append(j)
+
+        C = np.full(n, beta)
+        if rows:
+            rows = np.asarray(rows, dtype=np.intp)
+            cols = np.asarray(cols, dtype=np.intp)
+            # Bind the loop invariants to locals: no LOAD_ATTR chains
+            # inside the sweep.
+            lam = self.LAMBDA
+            bincount = np.bincount
+            # CENTRALITY_ITER is an upper bound; most graphs settle within
+            # a few sweeps, so stop as soon as the update is negligible.
+            for _ in range(self.CENTRALITY_ITER):
+                C_new = beta + lam * bincount(rows, weights=C[cols], minlength=n)
+                done = np.max(np.abs(C_new - C)) < 1e-6
+                C = C_new
+                if done:
+                    break
+
+        C *= 1.0 / C.max()
+        return dict(zip(ids, C.tolist()))
 
     
     #  FINAL SCORE CALCULATION (NOW WITH DEPTH DISCOUNT)
@@ -188,7 +438,6 @@ class PriorityEngine:
         importance = self.importance_score(task)
         effort = self.effort_factor(task)
 
-        value = urgency * self.W_URGENCY + importance * self.W_IMPORTANCE
         dependency_factor = self.direct_dependency_factor(task, dependents_count)
         centrality_factor = centrality_map.get(task.id, 1.0)
 
@@ -196,12 +445,9 @@ class PriorityEngine:
         depth = depth_map.get(task.id, 0)
         discount = 1.0 / (1.0 + depth)
 
-        final_score = (
-            value *
-            dependency_factor *
-            centrality_factor *
-            effort *
-            discount
+        final_score = self._combine(
+            urgency, importance, effort,
+            dependency_factor, centrality_factor, discount,
         )
         # Normalize final score
         # max_score = max(final_score, 1.0)
@@ -211,13 +457,60 @@ class PriorityEngine:
 
         return float(final_score)
 
-    
+
+    #  RUN CACHE
+    #  Keyed by a content hash of the task graph (fields + dep ids + today),
+    #  so repeated requests against an unchanged table skip the whole
+    #  cycle/centrality/scoring pipeline.
+
+    _RUN_CACHE_MAX = 128
+    _run_cache = OrderedDict()
+
+    def _fingerprint(self):
+        h = hashlib.blake2b(digest_size=16)
+        h.update(self.today.isoformat().encode())
+        for t in sorted(self.tasks, key=lambda t: t.id):
+            dep_ids = sorted(self._dep_ids[t.id])
+            # title and updated_at guard against id reuse: after a reset,
+            # fresh rows restart at id 1 and could otherwise collide with a
+            # cached run that holds the old Task instances.
+            h.update(
+                repr((t.id, t.title, str(getattr(t, "updated_at", None)),
+                      str(t.due_date), t.importance,
+                      t.estimated_hours, dep_ids)).encode()
+            )
+        return h.digest()
+
+
     #  RUN ENGINE
-    
-    def run(self):
+
+    def run(self, top_k=None):
+        """
+        Score all tasks, highest first. With `top_k`, only the k best entries
+        are returned and selected via partial sort (argpartition) rather than
+        a full O(N log N) sort.
+        """
         if not self.tasks:
             return [], []
 
+        cache = self.__class__._run_cache
+        key = (self._fingerprint(), top_k)
+        hit = cache.get(key)
+        if hit is not None:
+            cache.move_to_end(key)
+            scored, cyclic, reasons = hit
+            self._reasons = reasons
+            # Entries are immutable; copy just the lists so callers can
+            # sort/filter freely.
+            return list(scored), list(cyclic)
+
+        scored, cyclic = self._run(top_k)
+        cache[key] = (list(scored), list(cyclic), self._reasons)
+        if len(cache) > self._RUN_CACHE_MAX:
+            cache.popitem(last=False)
+        return scored, cyclic
+
+    def _run(self, top_k=None):
         # Detect cycles
         cyclic = self.detect_cycles()
         valid = [t for t in self.tasks if t.id not in cyclic]
@@ -225,118 +518,192 @@ class PriorityEngine:
         if not valid:
             return [], cyclic
 
-        # Build dependency graph
+        # Build dependency graph over the valid (acyclic) subgraph
+        valid_ids = {t.id for t in valid}
         dependents_count = defaultdict(int)
         adjacency = defaultdict(list)
+        deps_ids = {}
 
         for t in valid:
-            for dep in t.dependencies.all():
-                if dep.id not in cyclic:
-                    dependents_count[dep.id] += 1
-                    adjacency[dep.id].append(t.id)
+            t_deps = [d for d in self._dep_ids[t.id] if d in valid_ids]
+            deps_ids[t.id] = t_deps
+            for dep_id in t_deps:
+                dependents_count[dep_id] += 1
+                adjacency[dep_id].append(t.id)
+
+        # Removing every cycle member leaves a DAG, so a single Kahn pass
+        # yields a topological order; depth and centrality then become one
+        # linear sweep each instead of recursion + repeated graph passes.
+        order = self._topo_order(deps_ids)
 
-        # Depth computation
         depth_map = {}
-        for t in valid:
-            depth_map[t.id] = self.compute_depth(t, depth_map)
+        for node in order:
+            node_deps = deps_ids[node]
+            depth_map[node] = (
+                1 + max(depth_map[d] for d in node_deps) if node_deps else 0
+            )
+
+        centrality_map = self._centrality_from_topo(order, adjacency)
+
+        # Scoring: extract raw fields into parallel arrays (struct-of-arrays)
+        # and compute every component as a whole-array expression — the
+        # branchy per-task logic of urgency_score/importance_score/
+        # effort_factor becomes branchless where/clip over the vectors.
+        no_date = np.array([t.id not in self._due_delta for t in valid])
+        delta = np.array(
+            [self._due_delta.get(t.id, 0) for t in valid],
+            dtype=np.float64,
+        )
+        urgency = np.where(
+            delta < 0,
+            2.0 + np.minimum(np.abs(delta) / 7.0, 1.0),
+            1.0 + np.clip(self.U_MAX - delta, 0, self.U_MAX) / self.U_MAX,
+        )
+        urgency[no_date] = 0.5
+
+        imp_raw = np.array(
+            [self._imp_by_id[t.id] for t in valid], dtype=np.float64
+        )
+        importance = np.clip(imp_raw, 1, 10) / 10.0
+
+        hours_raw = np.array([self._hours_by_id[t.id] for t in valid])
+        effort = np.minimum(1.0 / np.maximum(hours_raw, 0.1), 10.0)
+        dep_count = np.array([dependents_count[t.id] for t in valid], dtype=np.float64)
+        centrality = np.array([centrality_map.get(t.id, 1.0) for t in valid])
+        depth = np.array([depth_map.get(t.id, 0) for t in valid], dtype=np.float64)
 
-        # Centrality
-        centrality_map = self.compute_centrality(adjacency)
+        scores = _score_all(
+            urgency, importance, effort, dep_count, centrality, depth,
+            self.W_URGENCY, self.W_IMPORTANCE, self.ALPHA,
+        )
 
-        # Scoring
-        scored = []
-        for task in valid:
-            score = self.calculate_score(task, dependents_count, centrality_map, depth_map)
-            scored.append({"task": task, "score": score})
+        # Keep the subscore columns so the views' "reason" payloads read a
+        # dict instead of re-running the four score methods per task.
+        # Effort mirrors effort_score (0 for missing/non-positive hours);
+        # dependency mirrors dependency_score (counts over all tasks).
+        raw_hours_attr = [getattr(t, "estimated_hours", None) for t in valid]
+        self._reasons = {
+            t.id: {
+                "urgency": float(u),
+                "importance": float(i),
+                "effort": float(e) if h is not None and h > 0 else 0.0,
+                "effort_factor": float(e),
+                "dependency": 1.0 + self.ALPHA * self._dependents_count.get(t.id, 0),
+            }
+            for t, u, i, e, h in zip(
+                valid, urgency, importance, effort, raw_hours_attr
+            )
+        }
+
+        if top_k is not None and 0 < top_k < len(valid):
+            # Select the k best in O(N), then order just those.
+            idx = np.argpartition(-scores, top_k - 1)[:top_k]
+            idx = idx[np.argsort(-scores[idx], kind="stable")]
+        else:
+            idx = np.argsort(-scores, kind="stable")
 
-        scored.sort(key=lambda x: x["score"], reverse=True)
+        scored = [
+            ScoredTask(valid[i], float(scores[i]))
+            for i in idx
+        ]
         return scored, cyclic
 
 
 
 # VALIDATION UTILITIES
 
+@lru_cache(maxsize=4096)
+def _validate_payload_cached(items, today):
+    """
+    Pure validation keyed by the payload's (field, value) pairs and today's
+    date, so retried/replayed submissions of identical tasks cost a dict
+    lookup instead of a full serializer pass. Lists travel as tuples to
+    stay hashable; results are returned in immutable form.
+    """
+    data = {k: list(v) if isinstance(v, tuple) else v for k, v in items}
+    serializer = TaskInputSerializer(data=data, context={"today": today})
+    if serializer.is_valid():
+        cleaned = dict(serializer.validated_data)
+        cleaned["dependencies"] = tuple(cleaned.get("dependencies", ()))
+        return True, tuple(cleaned.items()), ()
+
+    errors = tuple(
+        f"{field}: {message}"
+        for field, messages in serializer.errors.items()
+        for message in messages
+    )
+    return False, (), errors
+
+
 class TaskValidator:
     """Validates and sanitizes task input data."""
-    
-    @staticmethod
-    def validate_task_data(data):
+
+    def __init__(self, today=None):
+        # Resolved once per validator (i.e. once per request) so a batch
+        # of N tasks doesn't call date.today() N times.
+        self.today = today or datetime.date.today()
+
+    def validate_task_data(self, data):
         """
         Validates a single task dict. Returns (is_valid, cleaned_data, errors).
+
+        Field rules live on TaskInputSerializer, whose field map is compiled
+        once at class definition, instead of a hand-rolled try/except ladder.
+        Results are memoized per payload via _validate_payload_cached.
         """
-        errors = []
-        cleaned = {}
-        
-        # Required: title
-        title = data.get("title", "").strip()
-        if not title:
-            errors.append("Title is required and cannot be empty")
-            return False, cleaned, errors
-        else:
-            cleaned["title"] = title
-        
-        # Optional: due_date (REJECT past dates)
-        due_date = data.get("due_date")
-        if due_date:
-            try:
-                if isinstance(due_date, str):
-                    parsed = datetime.datetime.strptime(due_date, "%Y-%m-%d").date()
-                else:
-                    parsed = due_date
-                
-                # Check if date is in the past
-                today = datetime.date.today()
-                if parsed < today:
-                    errors.append(f"due_date cannot be in the past: {parsed}")
-                    return False, cleaned, errors
-                
-                cleaned["due_date"] = parsed
-            except (ValueError, TypeError):
-                errors.append(f"Invalid due_date format: {due_date}. Expected YYYY-MM-DD")
-                return False, cleaned, errors
-        
-        # Optional: estimated_hours (REJECT negative or zero)
-        hours = data.get("estimated_hours")
-        if hours is not None:
-            try:
-                hours_float = float(hours)
-                if hours_float < 0:
-                    errors.append(f"estimated_hours cannot be negative: {hours}")
-                    return False, cleaned, errors
-                elif hours_float == 0:
-                    errors.append("estimated_hours cannot be zero")
-                    return False, cleaned, errors
-                else:
-                    cleaned["estimated_hours"] = hours_float
-            except (ValueError, TypeError):
-                errors.append(f"Invalid estimated_hours: {hours}")
-                return False, cleaned, errors
-        else:
-            cleaned["estimated_hours"] = 2.0  # Default if missing
-        
-        # Optional: importance (REJECT out of range)
-        importance = data.get("importance")
-        if importance is not None:
+        if isinstance(data, dict):
+            # Treat explicit nulls like missing fields so defaults apply.
+            data = {k: v for k, v in data.items() if v is not None}
             try:
-                imp_int = int(importance)
-                if imp_int < 1 or imp_int > 10:
-                    errors.append(f"importance must be between 1-10, got: {imp_int}")
-                    return False, cleaned, errors
-                cleaned["importance"] = imp_int
-            except (ValueError, TypeError):
-                errors.append(f"Invalid importance: {importance}")
-                return False, cleaned, errors
-        else:
-            cleaned["importance"] = 5  # Default
-        
-        # Dependencies (will be resolved later)
-        deps = data.get("dependencies", [])
-        if not isinstance(deps, list):
-            errors.append(f"dependencies must be a list, got: {type(deps)}")
-            return False, cleaned, errors
-        else:
-            cleaned["dependencies"] = deps
-        
-        is_valid = len(errors) == 0
-        return is_valid, cleaned, errors
+                items = tuple(sorted(
+                    (k, tuple(v) if isinstance(v, list) else v)
+                    for k, v in data.items()
+                ))
+                ok, cleaned_items, errors = _validate_payload_cached(items, self.today)
+            except TypeError:
+                pass  # unhashable payload values — validate directly below
+            else:
+                cleaned = {
+                    k: list(v) if k == "dependencies" else v
+                    for k, v in cleaned_items
+                }
+                return ok, cleaned, list(errors)
+
+        serializer = TaskInputSerializer(data=data, context={"today": self.today})
+        if serializer.is_valid():
+            return True, dict(serializer.validated_data), []
+
+        errors = [
+            f"{field}: {message}"
+            for field, messages in serializer.errors.items()
+            for message in messages
+        ]
+        return False, {}, errors
+
+    def validate_batch(self, data_list):
+        """
+        Validates a whole payload list in one call. Returns
+        (valid_tasks_data, invalid_tasks): valid_tasks_data is a list of
+        (original_index, cleaned) pairs, invalid_tasks the per-task error
+        entries in the shape the analyze endpoint reports.
+
+        Sharing one validator instance means today is resolved once and
+        every task hits the same memoized per-payload cache.
+        """
+        valid_tasks_data = []
+        invalid_tasks = []
+        validate_one = self.validate_task_data
+
+        for i, data in enumerate(data_list):
+            is_valid, cleaned, errors = validate_one(data)
+            if is_valid:
+                valid_tasks_data.append((i, cleaned))
+            else:
+                invalid_tasks.append({
+                    "task_index": i + 1,
+                    "task_title": data.get("title", "Unknown"),
+                    "errors": errors
+                })
+
+        return valid_tasks_data, invalid_tasks
 
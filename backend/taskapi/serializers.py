@@ -1,6 +1,41 @@
+import datetime
+
 from rest_framework import serializers
 from .models import Task
 
+
+class TaskInputSerializer(serializers.Serializer):
+    """
+    Validates a raw task payload before any Task row exists.
+    `dependencies` holds 1-based indices into the submitted batch,
+    not primary keys — they are resolved later by the view.
+    """
+    title = serializers.CharField(max_length=255)
+    due_date = serializers.DateField(required=False)
+    estimated_hours = serializers.FloatField(required=False, default=2.0)
+    importance = serializers.IntegerField(
+        required=False, default=5, min_value=1, max_value=10
+    )
+    dependencies = serializers.ListField(
+        child=serializers.IntegerField(), required=False, default=list
+    )
+
+    def validate_due_date(self, value):
+        today = self.context.get("today") or datetime.date.today()
+        if value < today:
+            raise serializers.ValidationError(
+                f"due_date cannot be in the past: {value}"
+            )
+        return value
+
+    def validate_estimated_hours(self, value):
+        if value <= 0:
+            raise serializers.ValidationError(
+                "estimated_hours must be greater than zero"
+            )
+        return value
+
+
 class TaskSerializer(serializers.ModelSerializer):
     dependencies = serializers.PrimaryKeyRelatedField(
         many=True, queryset=Task.objects.all(), required=False
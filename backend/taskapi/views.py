@@ -3,43 +3,42 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from .models import Task
-from .serializers import TaskSerializer
 from .scoring.priority_engine import PriorityEngine, TaskValidator
-from django.db import connection
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Count, Max
+from collections import defaultdict
+from operator import attrgetter
+import hashlib
+import heapq
+import numpy as np
+
+# C-level sort/selection key for ScoredTask entries — no lambda frame
+# per comparison.
+_by_score = attrgetter("score")
+
+# Reset statements resolved once at import: the DB vendor cannot change
+# at runtime, so there is no per-request branch or string building.
+_RESET_SQL = {
+    'postgresql': (
+        # One statement: rows, through-table and sequences together.
+        "TRUNCATE TABLE taskapi_task_dependencies, taskapi_task "
+        "RESTART IDENTITY CASCADE;",
+    ),
+    'sqlite': (
+        "DELETE FROM taskapi_task_dependencies;",
+        "DELETE FROM taskapi_task;",
+        "DELETE FROM sqlite_sequence "
+        "WHERE name IN ('taskapi_task', 'taskapi_task_dependencies');",
+    ),
+}.get(connection.vendor, (
+    "DELETE FROM taskapi_task_dependencies;",
+    "DELETE FROM taskapi_task;",
+))
 import graphviz
-import base64
-import io
-import base64
-import matplotlib
-matplotlib.use('Agg')  # Use non-GUI backend
-import matplotlib.pyplot as plt
-import networkx as nx
-from django.http import HttpResponse
-from io import BytesIO
-#     def post(self, request):
-#         serializer = TaskSerializer(data=request.data, many=True)
-
-#         if not serializer.is_valid():
-#             return Response(serializer.errors, status=400)
-
-#         tasks = serializer.save()  # create in DB
-
-#         engine = PriorityEngine(tasks)
-#         scored, cycles = engine.run()
-
-#         output = []
-#         for item in scored:
-#             output.append({
-#                 "id": item["task"].id,
-#                 "title": item["task"].title,
-#                 "score": item["score"]
-#             })
-
-#         return Response({
-#             "scored_tasks": output,
-#             "cyclic_task_ids": cycles
-#         })
-        
+import orjson
+from django.http import HttpResponse, StreamingHttpResponse
+
 
 class AnalyzeTasksView(APIView):
     def post(self, request):
@@ -60,22 +59,9 @@ class AnalyzeTasksView(APIView):
                 "warnings": []
             }, status=status.HTTP_200_OK)
         
-        # Validate all tasks first
+        # Validate all tasks first, as one batch call
         validator = TaskValidator()
-        validation_results = []
-        all_errors = []
-        valid_tasks_data = []
-        
-        for i, data in enumerate(task_data):
-            is_valid, cleaned, errors = validator.validate_task_data(data)
-            if is_valid:
-                valid_tasks_data.append((i, cleaned))
-            else:
-                all_errors.append({
-                    "task_index": i + 1,
-                    "task_title": data.get("title", "Unknown"),
-                    "errors": errors
-                })
+        valid_tasks_data, all_errors = validator.validate_batch(task_data)
         
         # If ALL tasks are invalid, return error
         if not valid_tasks_data:
@@ -85,108 +71,155 @@ class AnalyzeTasksView(APIView):
                 "message": "Fix validation errors and try again"
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        # Phase 1: Create only VALID tasks
-        created = []
+        # Phase 1: Create only VALID tasks — one INSERT for the whole
+        # batch instead of one serializer.save() per task.
         dep_map = {}
         original_to_new_index = {}  # Map original index to new task index
         all_warnings = []
-        
+        to_create = []
+
         for idx, (original_idx, cleaned_data) in enumerate(valid_tasks_data):
-            deps = cleaned_data.pop("dependencies", [])
-            dep_map[idx] = deps
+            # Copy-without-key instead of pop(): the cleaned dict stays
+            # intact for any later re-validation or logging.
+            dep_map[idx] = cleaned_data.get("dependencies", [])
             original_to_new_index[original_idx] = idx
-            
-            serializer = TaskSerializer(data=cleaned_data)
-            if serializer.is_valid():
-                created.append(serializer.save())
-            else:
-                all_warnings.append(
-                    f"Task {original_idx+1} serialization failed: {serializer.errors}"
-                )
-        
+            to_create.append(Task(**{
+                k: v for k, v in cleaned_data.items() if k != "dependencies"
+            }))
+
+        invalid_dependencies = []
+
+        with transaction.atomic():
+            created = Task.objects.bulk_create(to_create)
+            index_map = {i: t for i, t in enumerate(created)}
+
+            # Phase 2: Resolve dependencies with validation, then write
+            # every edge in a single through-table INSERT instead of a
+            # DELETE+INSERT per task via .set().
+            through = Task.dependencies.through
+            edges = []
+
+            for i, deps in dep_map.items():
+                from_id = index_map[i].id
+                for d in deps:
+                    # Check for self-dependency
+                    if d == (i + 1):
+                        invalid_dependencies.append(
+                            f"Task {i+1} cannot depend on itself (dep: {d})"
+                        )
+                        continue
+
+                    # One .get() both checks existence and fetches the task
+                    dep_task = index_map.get(d - 1)
+                    if dep_task is None:
+                        invalid_dependencies.append(
+                            f"Task {i+1} has non-existent dependency: {d}"
+                        )
+                        continue
+
+                    edges.append(through(
+                        from_task_id=from_id,
+                        to_task_id=dep_task.id,
+                    ))
+
+            if edges:
+                through.objects.bulk_create(edges, ignore_conflicts=True)
+
         if not created:
             return Response({
                 "error": "No tasks could be created after validation",
                 "invalid_tasks": all_errors,
                 "warnings": all_warnings
             }, status=status.HTTP_400_BAD_REQUEST)
-        
-        index_map = {i: t for i, t in enumerate(created)}
-        
-        # Phase 2: Resolve dependencies with validation
-        invalid_dependencies = []
-        
-        for i, deps in dep_map.items():
-            resolved = []
-            for d in deps:
-                # Check for self-dependency
-                if d == (i + 1):
-                    invalid_dependencies.append(
-                        f"Task {i+1} cannot depend on itself (dep: {d})"
-                    )
-                    continue
-                
-                # Check if dependency exists
-                dep_index = d - 1
-                if dep_index not in index_map:
-                    invalid_dependencies.append(
-                        f"Task {i+1} has non-existent dependency: {d}"
-                    )
-                    continue
-                
-                resolved.append(index_map[dep_index])
-            
-            index_map[i].dependencies.set(resolved)
-        
+
         all_warnings.extend(invalid_dependencies)
         
-        # Phase 3: Run scoring engine
-        all_tasks = Task.objects.all().order_by("id")
-        engine = PriorityEngine(all_tasks)
+        # Phase 3: Run scoring engine over just this batch (dependent
+        # counts aggregated SQL-side). Dependencies are resolved by batch
+        # index, so edges never cross batches: the created set is its own
+        # transitive closure and historical tasks cannot affect these
+        # scores. This keeps the engine input O(batch) as the table grows.
+        created_ids = {t.id for t in created}
+        batch_tasks = Task.objects.filter(id__in=created_ids).annotate(
+            num_dependents=Count("task", distinct=True)
+        ).order_by("id")
+        engine = PriorityEngine(batch_tasks)
         scored, cycles = engine.run()        
         
+        # Persist the fresh scores so other consumers can order by
+        # priority with an indexed SQL sort instead of re-running the
+        # engine. bulk_update skips auto_now, so this does not churn the
+        # updated_at version signal.
+        for e in scored:
+            e.task.priority_score = e.score
+        Task.objects.bulk_update(
+            [e.task for e in scored], ["priority_score"], batch_size=500
+        )
+
         # Add cycle warnings
         if cycles:
             all_warnings.append(
                 f"Circular dependencies detected in tasks: {cycles}"
             )
         
-        # Phase 4: Separate blocked vs unblocked
-        def is_blocked(entry):
-            return entry["task"].dependencies.exists()
-        
-        unblocked = [e for e in scored if not is_blocked(e)]
-        blocked_tasks = [e for e in scored if is_blocked(e)]
-        
-        unblocked.sort(key=lambda x: x["score"], reverse=True)
-        blocked_tasks.sort(key=lambda x: x["score"], reverse=True)
-        
-        ordered = unblocked + blocked_tasks
-        
-# Filter to include only tasks submitted in this request
-        created_ids = {t.id for t in created}
-        ordered = [e for e in ordered if e["task"].id in created_ids]
-        # Phase 5: Format response with invalid task info
+        # Phase 4: One ordering pass — unblocked before blocked, score
+        # descending — instead of two filter passes plus two sorts. The
+        # blocked flag is a dict probe into the engine's prefetched
+        # adjacency, not an EXISTS query per task.
+        has_deps = {tid: bool(deps) for tid, deps in engine._dep_ids.items()}
+        blocked_get = has_deps.get
+
+        # Everything scored belongs to this request's batch, so no
+        # post-hoc created_ids filter is needed.
+        ordered = sorted(scored, key=lambda e: (blocked_get(e.task.id, False), -e.score))
+        blocked_count = sum(1 for e in scored if blocked_get(e.task.id, False))
+
+        # Phase 5: Format response with invalid task info. Subscores come
+        # from the components run() already computed, rounded as whole
+        # columns instead of four round() calls per task.
+        reasons = engine._reasons
+        n = len(ordered)
+        scores_r = np.round(
+            np.fromiter((e.score for e in ordered), np.float64, count=n), 4
+        )
+        urgency_r = np.round(
+            np.fromiter(
+                (reasons[e.task.id]["urgency"] for e in ordered),
+                np.float64, count=n,
+            ), 2,
+        )
+        importance_r = np.round(
+            np.fromiter(
+                (reasons[e.task.id]["importance"] for e in ordered),
+                np.float64, count=n,
+            ), 2,
+        )
+        effort_r = np.round(
+            np.fromiter(
+                (reasons[e.task.id]["effort_factor"] for e in ordered),
+                np.float64, count=n,
+            ), 2,
+        )
         response_data = {
             "scored_tasks": [
                 {
-                    "id": e["task"].id,
-                    "title": e["task"].title,
-                    "score": round(e["score"], 4),
-                    "blocked": is_blocked(e),
-                    "blocked_by": [dep.id for dep in e["task"].dependencies.all()],
-                    "urgency": round(engine.urgency_score(e["task"]), 2),
-                    "importance": round(engine.importance_score(e["task"]), 2),
-                    "effort_factor": round(engine.effort_factor(e["task"]), 2)
+                    "id": e.task.id,
+                    "title": e.task.title,
+                    "score": float(scores_r[k]),
+                    "blocked": blocked_get(e.task.id, False),
+                    "blocked_by": list(engine._dep_ids.get(e.task.id, [])),
+                    "urgency": float(urgency_r[k]),
+                    "importance": float(importance_r[k]),
+                    "effort_factor": float(effort_r[k])
                 }
-                for e in ordered
+                for k, e in enumerate(ordered)
             ],
             "cyclic_task_ids": cycles,
             "stats": {
                 "total_submitted": len(task_data),
                 "valid_tasks": len(created),
                 "invalid_tasks": len(all_errors),
-                "blocked_tasks": len(blocked_tasks),
+                "blocked_tasks": blocked_count,
                 "cyclic_tasks": len(cycles)
             }
         }
@@ -202,16 +235,27 @@ class AnalyzeTasksView(APIView):
         return Response(response_data)
 
 class SuggestTasksView(APIView):
+    # Suggestions are read far more often than tasks change: cache the
+    # response body keyed on a cheap table version (row count + max
+    # updated_at), so repeat GETs against unchanged data skip the engine.
+    CACHE_TTL = 300
+
     def get(self, request):
-        tasks = Task.objects.all()
-        
-        if not tasks.exists():
+        version = Task.objects.aggregate(cnt=Count("id"), mx=Max("updated_at"))
+
+        if not version["cnt"]:
             return Response({
                 "message": "No tasks available to suggest",
                 "top_tasks": [],
                 "cyclic_task_ids": []
             })
-        
+
+        cache_key = f"suggest:{version['cnt']}:{version['mx'].isoformat()}"
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return Response(cached)
+
+        tasks = Task.objects.annotate(num_dependents=Count("task", distinct=True))
         engine = PriorityEngine(tasks)
         scored, cycles = engine.run()
         
@@ -222,94 +266,99 @@ class SuggestTasksView(APIView):
                 "cyclic_task_ids": cycles
             })
         
-        # Separate blocked vs unblocked
-        def is_blocked(entry):
-            return entry["task"].dependencies.exists()
-        
-        unblocked = [e for e in scored if not is_blocked(e)]
-        blocked = [e for e in scored if is_blocked(e)]
-        
-        unblocked.sort(key=lambda x: x["score"], reverse=True)
-        blocked.sort(key=lambda x: x["score"], reverse=True)
-        
-        ordered = unblocked + blocked
-        top = ordered[:3]
+        # Separate blocked vs unblocked via the engine's prefetched
+        # adjacency — a dict probe per entry, no EXISTS query.
+        dep_ids = engine._dep_ids
+        unblocked = [e for e in scored if not dep_ids.get(e.task.id)]
+        blocked = [e for e in scored if dep_ids.get(e.task.id)]
+
+        # Partial sort: only 3 entries are ever shown, so pick them with
+        # heapq.nlargest instead of fully sorting both partitions.
+        top = heapq.nlargest(3, unblocked, key=_by_score)
+        if len(top) < 3:
+            top += heapq.nlargest(3 - len(top), blocked, key=_by_score)
         
         # Format response
         formatted = []
         for entry in top:
-            t = entry["task"]
+            t = entry.task
+            # Subscores were captured during engine.run(); no recompute.
+            reason = engine._reasons[t.id]
             formatted.append({
                 "id": t.id,
                 "title": t.title,
-                "score": round(entry["score"], 4),
-                "blocked": is_blocked(entry),
-                "blocked_by": [dep.id for dep in t.dependencies.all()],
+                "score": round(entry.score, 4),
+                "blocked": bool(dep_ids.get(t.id)),
+                "blocked_by": list(dep_ids.get(t.id, [])),
                 "reason": {
-                    "urgency": round(engine.urgency_score(t), 2),
-                    "importance": round(engine.importance_score(t), 2),
-                    "effort": round(engine.effort_score(t), 2),
-                    "dependency": round(engine.dependency_score(t), 2)
+                    "urgency": round(reason["urgency"], 2),
+                    "importance": round(reason["importance"], 2),
+                    "effort": round(reason["effort"], 2),
+                    "dependency": round(reason["dependency"], 2)
                 }
             })
         
-        return Response({
+        body = {
             "top_tasks": formatted,
             "cyclic_task_ids": cycles,
             "total_available": len(scored)
-        })
+        }
+        cache.set(cache_key, body, self.CACHE_TTL)
+        return Response(body)
 class ResetTasksView(APIView):
+    """
+    Safely reset the Task table so test cases can be run repeatedly.
+    """
     def delete(self, request):
-        # Delete all tasks
-        Task.objects.all().delete()
-
-        # Reset ID auto-increment for SQLite or Postgres
-        with connection.cursor() as cursor:
-            vendor = connection.vendor
-
-            if vendor == 'sqlite':
-                cursor.execute("DELETE FROM sqlite_sequence WHERE name='taskapi_task';")
-
-            elif vendor == 'postgresql':
-                cursor.execute("ALTER SEQUENCE taskapi_task_id_seq RESTART WITH 1;")
+        # Wipe with raw SQL: the ORM delete materializes every row to fire
+        # signals and cascades the M2M through-table in per-batch DELETEs,
+        # then the sequence reset needs yet another statement. The vendor-
+        # specific statements are precomputed at import (_RESET_SQL).
+        with transaction.atomic(), connection.cursor() as cursor:
+            for sql in _RESET_SQL:
+                cursor.execute(sql)
 
         return Response(
             {"message": "Tasks wiped. ID counter reset to 1."},
             status=status.HTTP_200_OK
         )
-    """
-    Safely reset the Task table so test cases can be run repeatedly.
-    """
-
-    # def delete(self, request):
-    #     # Delete all Task rows
-    #     Task.objects.all().delete()
 
-    #     return Response(
-    #         {"message": "All tasks deleted. Database is clean."},
-    #         status=status.HTTP_200_OK
-    #     )
-    
 class ListTasksView(APIView):
     """
     Returns all tasks currently stored in the database,
     including dependency IDs for verification.
-    """
-    def get(self, request):
-        tasks = Task.objects.all().order_by("id")
 
-        data = []
-        for t in tasks:
-            data.append({
-                "id": t.id,
-                "title": t.title,
-                "due_date": t.due_date,
-                "estimated_hours": t.estimated_hours,
-                "importance": t.importance,
-                "dependencies": [dep.id for dep in t.dependencies.all()]
-            })
+    Streamed: rows are encoded and written in chunks, so peak memory is
+    bounded by CHUNK_SIZE rows instead of the whole table.
+    """
+    CHUNK_SIZE = 500
 
-        return Response({"tasks": data}, status=200)
+    def get(self, request):
+        # Two queries total: a .values() projection (no model instances)
+        # plus one pass over the through-table, instead of an M2M SELECT
+        # per task.
+        dep_map = defaultdict(list)
+        through = Task.dependencies.through
+        for from_id, to_id in through.objects.values_list(
+            "from_task_id", "to_task_id"
+        ):
+            dep_map[from_id].append(to_id)
+
+        rows = Task.objects.order_by("id").values(
+            "id", "title", "due_date", "estimated_hours", "importance"
+        ).iterator(chunk_size=self.CHUNK_SIZE)
+
+        def stream():
+            yield b'{"tasks":['
+            first = True
+            for row in rows:
+                row["dependencies"] = dep_map.get(row["id"], [])
+                encoded = orjson.dumps(row)
+                yield encoded if first else b"," + encoded
+                first = False
+            yield b"]}"
+
+        return StreamingHttpResponse(stream(), content_type="application/json")
 
 class DeleteTasksView(APIView):
     def delete(self, request):
@@ -342,16 +391,28 @@ class DeleteTasksView(APIView):
                 )
 
         elif body_ids:
+            # Two queries for the whole batch (existence check + bulk
+            # delete) instead of a SELECT and DELETE per id.
             invalid = []
             deleted = []
+            numeric = []
 
             for tid in body_ids:
                 try:
-                    Task.objects.get(id=tid).delete()
-                    deleted.append(tid)
-                except Task.DoesNotExist:
+                    numeric.append((tid, int(tid)))
+                except (TypeError, ValueError):
                     invalid.append(tid)
 
+            existing = set(
+                Task.objects.filter(id__in=[n for _, n in numeric])
+                .values_list("id", flat=True)
+            )
+            with transaction.atomic():
+                Task.objects.filter(id__in=existing).delete()
+
+            for tid, n in numeric:
+                (deleted if n in existing else invalid).append(tid)
+
             return Response({
                 "deleted": deleted,
                 "invalid_or_missing": invalid,
@@ -365,125 +426,116 @@ class DeleteTasksView(APIView):
             )
 
 
-    class GraphView(APIView):
-        def get(self, request):
-            tasks = Task.objects.all()
-            engine = PriorityEngine(tasks)
-            cyclic = set(engine.detect_cycles())
-
-            dot = graphviz.Digraph()
-
-            for t in tasks:
-                color = "red" if t.id in cyclic else "black"
-                dot.node(str(t.id), t.title, color=color)
-
-                for dep in t.dependencies.all():
-                    dot.edge(str(dep.id), str(t.id))
-
-            return Response({"graph_dot": dot.source})
-        
-
 class EisenhowerView(APIView):
-    def get(self, request):
-        tasks = Task.objects.all()
-        engine = PriorityEngine(tasks)
-
-        urgency_values = []
-        importance_values = []
+    # Indexed by 2*(urgent) + (important), matching the old branch ladder.
+    QUADRANTS = ("Delete", "Plan", "Delegate", "Do")
 
-        # Compute normalized urgency & importance
-        raw_data = []
-        for t in tasks:
-            U_raw = engine.urgency_score(t)     # ~1.0 → 3.0
-            I = engine.importance_score(t)      # 0 → 1
-
-            # Normalize urgency into 0–1
-            U = (U_raw - 1.0) / (3.0 - 1.0)
-            U = max(0, min(1, U))
-
-            raw_data.append((t, U, I))
-            urgency_values.append(U)
-            importance_values.append(I)
+    def get(self, request):
+        # Hand the engine the queryset, not a list: the queryset branch
+        # loads the whole adjacency in one through-table query instead of
+        # one dependencies.all() round trip per task.
+        engine = PriorityEngine(Task.objects.all())
+        tasks = engine.tasks
+        if not tasks:
+            return Response({"matrix": []})
+
+        n = len(tasks)
+
+        # One engine pass serves everything: scores for tie-breaking plus
+        # the urgency/importance components, which the quadrant columns
+        # reuse instead of recomputing per task. Cyclic tasks are absent
+        # from the component map, so they fall back to the score methods.
+        scored, _ = engine.run()
+        score_map = {x.task.id: x.score for x in scored}
+        reasons = engine._reasons
+
+        U = np.fromiter(
+            (
+                reasons[t.id]["urgency"] if t.id in reasons
+                else engine.urgency_score(t)
+                for t in tasks
+            ),
+            np.float64, count=n,
+        )
+        # Normalize urgency (~1.0-3.0) into 0-1 as a whole column.
+        U = np.clip((U - 1.0) / 2.0, 0.0, 1.0)
+        I = np.fromiter(
+            (
+                reasons[t.id]["importance"] if t.id in reasons
+                else engine.importance_score(t)
+                for t in tasks
+            ),
+            np.float64, count=n,
+        )
 
-        # Dynamic thresholds
-        urgency_values.sort()
-        importance_values.sort()
+        # Dynamic thresholds: the same middle element the old sorted-list
+        # lookup used, found in O(N) with a partition instead of a sort.
+        mid_u = np.partition(U, n // 2)[n // 2]
+        mid_i = np.partition(I, n // 2)[n // 2]
 
-        mid_u = urgency_values[len(urgency_values)//2]
-        mid_i = importance_values[len(importance_values)//2]
+        # Branchless quadrant assignment: two comparisons per column and
+        # a lookup into QUADRANTS.
+        q_idx = (U >= mid_u).astype(np.int8) * 2 + (I >= mid_i)
+        U_r = np.round(U, 3)
+        I_r = np.round(I, 3)
 
-        # Also compute priority scores to help tie-breaking
-        scored, _ = engine.run()
-        score_map = {x["task"].id: x["score"] for x in scored}
-
-        response = []
-        for t, U, I in raw_data:
-            score = score_map.get(t.id, 0.0)
-
-            # Quadrant logic with score as stabilizer
-            if U >= mid_u and I >= mid_i:
-                quadrant = "Do"
-            elif U < mid_u and I >= mid_i:
-                quadrant = "Plan"
-            elif U >= mid_u and I < mid_i:
-                quadrant = "Delegate"
-            else:
-                quadrant = "Delete"
-            response.append({
+        response = [
+            {
                 "id": t.id,
                 "title": t.title,
-                "urgency": round(U, 3),
-                "importance": round(I, 3),
-                "score": round(score, 4),
-                "quadrant": quadrant
-            })
+                "urgency": float(U_r[k]),
+                "importance": float(I_r[k]),
+                "score": round(score_map.get(t.id, 0.0), 4),
+                "quadrant": self.QUADRANTS[q_idx[k]]
+            }
+            for k, t in enumerate(tasks)
+        ]
 
         return Response({"matrix": response})
 
 
 class GraphView(APIView):
+    # Layout dominates this endpoint; the graph only changes when tasks
+    # do, so cache the finished image.
+    CACHE_TTL = 3600
+
     def get(self, request):
-        tasks = Task.objects.all()
-        engine = PriorityEngine(tasks)
+        # Content hash of everything that influences the drawing: same
+        # nodes, titles and edges produce byte-identical output. Built
+        # from two flat queries so a cache hit does no per-task work and
+        # never constructs the engine.
+        nodes = list(Task.objects.order_by("id").values_list("id", "title"))
+        edges = sorted(
+            Task.dependencies.through.objects.values_list(
+                "from_task_id", "to_task_id"
+            )
+        )
+        key_src = repr((nodes, edges)).encode()
+        cache_key = "graph-svg:" + hashlib.blake2b(key_src, digest_size=16).hexdigest()
+        svg = cache.get(cache_key)
+        if svg is not None:
+            return HttpResponse(svg, content_type='image/svg+xml')
+
+        engine = PriorityEngine(Task.objects.all())
+        tasks = engine.tasks
+        dep_ids = engine._dep_ids
         cyclic = set(engine.detect_cycles())
 
-        # Create directed graph
-        G = nx.DiGraph()
-        
-        # Add nodes and edges
+        # Build the graph for dot: its C layout engine replaces the old
+        # Python spring-force simulation, and SVG output skips matplotlib
+        # rasterization and PNG encoding entirely.
+        dot = graphviz.Digraph()
+        dot.attr(rankdir='LR')
+
         for t in tasks:
-            G.add_node(t.id, title=t.title, cyclic=t.id in cyclic)
-            for dep in t.dependencies.all():
-                G.add_edge(dep.id, t.id)
+            dot.node(
+                str(t.id), t.title,
+                style='filled',
+                fillcolor='red' if t.id in cyclic else 'lightblue',
+            )
+            for dep_id in dep_ids.get(t.id, ()):
+                dot.edge(str(dep_id), str(t.id))
 
-        # Create figure
-        fig, ax = plt.subplots(figsize=(12, 8))
-        pos = nx.spring_layout(G, k=2, iterations=50)
-        
-        # Separate cyclic and normal nodes
-        cyclic_nodes = [n for n in G.nodes() if G.nodes[n].get('cyclic', False)]
-        normal_nodes = [n for n in G.nodes() if not G.nodes[n].get('cyclic', False)]
-        
-        # Draw nodes
-        nx.draw_networkx_nodes(G, pos, nodelist=normal_nodes, 
-                               node_color='lightblue', node_size=1000, ax=ax)
-        nx.draw_networkx_nodes(G, pos, nodelist=cyclic_nodes, 
-                               node_color='red', node_size=1000, ax=ax)
-        
-        # Draw edges and labels
-        nx.draw_networkx_edges(G, pos, edge_color='gray', 
-                               arrows=True, arrowsize=20, ax=ax)
-        
-        labels = {t.id: t.title for t in tasks}
-        nx.draw_networkx_labels(G, pos, labels, font_size=8, ax=ax)
-        
-        plt.axis('off')
-        plt.tight_layout()
-        
-        # Save to bytes
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png', dpi=100, bbox_inches='tight')
-        buf.seek(0)
-        plt.close(fig)
-        
-        return HttpResponse(buf.getvalue(), content_type='image/png')
\ No newline at end of file
+        svg = dot.pipe(format='svg')
+        cache.set(cache_key, svg, self.CACHE_TTL)
+        return HttpResponse(svg, content_type='image/svg+xml')
\ No newline at end of file